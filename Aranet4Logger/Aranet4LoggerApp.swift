@@ -22,8 +22,7 @@ struct Aranet4LoggerApp: App {
                 updater: coordinator.updater,
                 onSyncNow: { coordinator.coordinator.syncNow() },
                 onToggleLogin: { enabled in
-                    LoginItemManager.setEnabled(enabled)
-                    coordinator.coordinator.appState.launchAtLogin = LoginItemManager.isEnabled
+                    coordinator.coordinator.appState.launchAtLogin = LoginItemManager.setEnabled(enabled)
                 },
                 onImportCSV: { deviceID, url in
                     coordinator.coordinator.importCSV(url: url, deviceID: deviceID)
@@ -50,11 +49,27 @@ struct Aranet4LoggerApp: App {
 final class AppCoordinatorHolder {
     let coordinator: Coordinator
     let updater: UpdaterManager
+    /// SIGTERM (`kill`, `launchctl stop`) skips NSApplication's termination path; route it
+    /// through `terminate` so the `willTerminate` cleanup below still runs.
+    private let sigtermSource: DispatchSourceSignal
 
     init() {
         coordinator = Coordinator()
         coordinator.start()
         coordinator.appState.launchAtLogin = LoginItemManager.isEnabled
         updater = UpdaterManager()
+
+        signal(SIGTERM, SIG_IGN)
+        sigtermSource = DispatchSource.makeSignalSource(signal: SIGTERM, queue: .main)
+        sigtermSource.setEventHandler {
+            MainActor.assumeIsolated { NSApplication.shared.terminate(nil) }
+        }
+        sigtermSource.resume()
+
+        _ = NotificationCenter.default.addObserver(
+            forName: NSApplication.willTerminateNotification, object: nil, queue: .main
+        ) { [coordinator] _ in
+            MainActor.assumeIsolated { coordinator.stop() }
+        }
     }
 }
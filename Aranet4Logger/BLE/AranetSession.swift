@@ -109,16 +109,17 @@ final class AranetSession: NSObject, @unchecked Sendable {
                                            cmd: cmdChar, history: historyChar)
 
         let deviceID = peripheral.identifier.uuidString
+        // Snap to the logging-interval grid so the same reading gets a stable key across syncs
+        // (enables dedup) and aligns with imported CSV data. Older samples are whole intervals
+        // before the newest, so snapping it once puts every sample on the grid.
+        let newest = TimeGrid.snap(lastLogged, intervalSeconds: interval)
         var readings: [Reading] = []
         readings.reserveCapacity(total - startIndex + 1)
         for j in (startIndex - 1)..<total {
             let age = Double(total - j - 1) * Double(interval)
-            // Snap to the logging-interval grid so the same reading gets a stable key across
-            // syncs (enables dedup) and aligns with imported CSV data.
-            let ts = TimeGrid.snap(lastLogged.addingTimeInterval(-age), intervalSeconds: interval)
             readings.append(Reading(
                 deviceID: deviceID,
-                timestamp: ts,
+                timestamp: newest.addingTimeInterval(-age),
                 co2: co2[j].map { Int($0) },
                 temperature: temp[j],
                 humidity: humi[j],
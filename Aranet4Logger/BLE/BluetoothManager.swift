@@ -183,12 +183,15 @@ extension BluetoothManager: CBCentralManagerDelegate {
         let name = peripheral.name ?? advertisementData[CBAdvertisementDataLocalNameKey] as? String
         let mfgData = advertisementData[CBAdvertisementDataManufacturerDataKey] as? Data
 
-        // Only care about Aranet devices: either a recognizable name or SAF manufacturer ID.
-        var isAranet = (name?.contains("Aranet")) ?? false
+        // Only care about Aranet devices: either the SAF manufacturer ID or a recognizable name.
+        // With duplicates enabled this runs for every advertisement from every nearby device, so
+        // the two-byte company ID is checked first and the name search only runs without a match.
+        var isAranet = false
         if let mfg = mfgData, mfg.count >= 2 {
             let companyID = UInt16(mfg[mfg.startIndex]) | (UInt16(mfg[mfg.startIndex + 1]) << 8)
-            if companyID == AranetProtocol.manufacturerID { isAranet = true }
+            isAranet = companyID == AranetProtocol.manufacturerID
         }
+        if !isAranet { isAranet = (name?.contains("Aranet")) ?? false }
         guard isAranet else { return }
 
         discovered[peripheral.identifier] = peripheral
@@ -66,9 +66,10 @@ enum CSVImporter {
             if isFirstLine { isFirstLine = false; return }   // header
             let trimmed = line.trimmingCharacters(in: .whitespacesAndNewlines)
             if trimmed.isEmpty { return }
-            // Fields are quoted and contain no embedded commas, so strip quotes and split.
-            let fields = trimmed.replacingOccurrences(of: "\"", with: "").components(separatedBy: ",")
-            guard fields.count >= 5, let date = formatter.date(from: fields[0]) else { return }
+            // Fields are quoted and contain no embedded commas, so split and unquote each field
+            // as a Substring of the line (no per-field String copies).
+            let fields = trimmed.split(separator: ",", omittingEmptySubsequences: false).map(unquote)
+            guard fields.count >= 5, let date = formatter.date(from: String(fields[0])) else { return }
 
             let tempC = Double(fields[2]).map { ($0 - 32.0) * 5.0 / 9.0 }
             rows.append(ParsedRow(
@@ -82,13 +83,24 @@ enum CSVImporter {
 
         guard !rows.isEmpty else { throw ImportError.noRows }
         rows.sort { $0.date < $1.date }
-        return (rows, inferInterval(rows.map { $0.date }))
+        // Only the most recent samples feed the inference; don't copy every date to get them.
+        return (rows, inferInterval(rows.suffix(intervalSampleSize).map { $0.date }))
     }
 
+    private static func unquote(_ field: Substring) -> Substring {
+        var field = field
+        if field.first == "\"" { field.removeFirst() }
+        if field.last == "\"" { field.removeLast() }
+        return field
+    }
+
+    /// How many of the most recent samples `inferInterval` looks at.
+    private static let intervalSampleSize = 500
+
     /// Most common spacing (seconds) between consecutive recent samples.
     static func inferInterval(_ dates: [Date]) -> Int {
         guard dates.count >= 2 else { return 0 }
-        let recent = dates.suffix(500)
+        let recent = dates.suffix(intervalSampleSize)
         var counts: [Int: Int] = [:]
         var prev: Date?
         for d in recent {
@@ -3,6 +3,13 @@ import Foundation
 /// Loads and persists `AppConfig` as JSON in Application Support. On first run it writes the
 /// default config (prefilled with the two known devices).
 enum ConfigStore {
+    /// Built once rather than per save.
+    private static let encoder: JSONEncoder = {
+        let e = JSONEncoder()
+        e.outputFormatting = [.prettyPrinted, .sortedKeys]
+        return e
+    }()
+
     static func load() -> AppConfig {
         let url = AppPaths.config
         guard let data = try? Data(contentsOf: url) else {
@@ -19,8 +26,6 @@ enum ConfigStore {
     }
 
     static func save(_ config: AppConfig) {
-        let encoder = JSONEncoder()
-        encoder.outputFormatting = [.prettyPrinted, .sortedKeys]
         do {
             let data = try encoder.encode(config)
             try data.write(to: AppPaths.config, options: .atomic)
@@ -19,6 +19,8 @@ final class Coordinator {
     /// callback for a windowless menu bar app). Idle system sleep is still allowed — history
     /// backfill covers any sleep gap.
     private var activityToken: NSObjectProtocol?
+    /// Pending coalesced config write from `scheduleConfigSave`.
+    private var configSaveTask: Task<Void, Never>?
 
     init() {
         self.appState = AppState()
@@ -51,6 +53,20 @@ final class Coordinator {
         refreshStoredCounts()
     }
 
+    /// Stop all collectors and flush the log before the process exits. A sync cut off midway is
+    /// harmless: its rows were either committed or will be backfilled on the next launch.
+    func stop() {
+        for task in collectorTasks.values { task.cancel() }
+        collectorTasks.removeAll()
+        if configSaveTask != nil { saveConfig() }
+        if let activityToken {
+            ProcessInfo.processInfo.endActivity(activityToken)
+            self.activityToken = nil
+        }
+        AppLog.shared.info("Aranet4Logger stopping")
+        AppLog.shared.flush()
+    }
+
     /// Trigger an immediate sync for all devices.
     func syncNow() {
         for signal in Array(syncSignals.values) { signal.resume() }
@@ -81,7 +97,7 @@ final class Coordinator {
         let friendly = name ?? "Aranet4 \(id.prefix(8))"
         let device = DeviceConfig(id: id, name: friendly)
         config.devices.append(device)
-        ConfigStore.save(config)
+        saveConfig()
         appState.devices.append(DeviceState(id: id, name: friendly))
         AppLog.shared.info("Discovered new device \(id) (\(friendly)); added to config")
         startCollector(for: device)
@@ -92,32 +108,51 @@ final class Coordinator {
         }
     }
 
-    /// Rename a configured device. Persists immediately and updates the live UI. Called from the
-    /// Settings window as the user edits the name field.
+    /// Rename a configured device. Updates the live UI immediately and persists once typing
+    /// pauses. Called from the Settings window as the user edits the name field.
     func rename(deviceID: String, to newName: String) {
-        guard let idx = config.devices.firstIndex(where: { $0.id == deviceID }) else { return }
+        guard let idx = config.devices.firstIndex(where: { $0.id == deviceID }),
+              config.devices[idx].name != newName else { return }
         config.devices[idx].name = newName
-        ConfigStore.save(config)
+        scheduleConfigSave()
         appState.device(deviceID)?.name = newName
     }
 
+    // MARK: - Config persistence
+
+    /// Write the config once edits settle, rather than once per keystroke of a rename.
+    private func scheduleConfigSave() {
+        configSaveTask?.cancel()
+        configSaveTask = Task { [weak self] in
+            try? await Task.sleep(nanoseconds: 1_000_000_000)
+            guard !Task.isCancelled else { return }
+            self?.saveConfig()
+        }
+    }
+
+    /// Write the config now, superseding any pending coalesced write.
+    private func saveConfig() {
+        configSaveTask?.cancel()
+        configSaveTask = nil
+        ConfigStore.save(config)
+    }
+
     // MARK: - Live data
 
     private func applyLive(_ live: LiveReading) {
         appState.bluetoothReady = true
-        if appState.device(live.deviceID) == nil {
+        // Runs for every advertisement, so look the device up once on the common path.
+        let dev: DeviceState
+        if let known = appState.device(live.deviceID) {
+            dev = known
+        } else {
             addDiscoveredDevice(id: live.deviceID, name: live.name)
+            guard let added = appState.device(live.deviceID) else { return }
+            dev = added
         }
-        guard let dev = appState.device(live.deviceID) else { return }
         dev.rssi = live.rssi
         dev.lastSeen = live.date
-        if let r = live.reading {
-            if let v = r.co2 { dev.co2 = v }
-            if let v = r.temperature { dev.temperature = v }
-            if let v = r.humidity { dev.humidity = v }
-            if let v = r.pressure { dev.pressure = v }
-            if let v = r.battery { dev.battery = v }
-        }
+        if let r = live.reading { dev.apply(r) }
     }
 
     // MARK: - Collectors
@@ -133,9 +168,19 @@ final class Coordinator {
                 AppLog.shared.error("Invalid device id \(device.id)")
                 return
             }
+            // Polls are scheduled against absolute deadlines, so the time a sync takes (connects
+            // and retries can run for minutes) doesn't push every later poll back.
+            var deadline = ContinuousClock.now
             while !Task.isCancelled {
                 await self.syncOnce(deviceID: device.id, uuid: uuid)
-                await self.waitForNextCycle(deviceID: device.id)
+                let interval = Duration.seconds(max(1, self.config.pollInterval))
+                deadline += interval
+                // Overran the interval: skip the missed slots rather than syncing back to back,
+                // so a sensor that is out of range still waits before hogging the radio again.
+                while deadline <= ContinuousClock.now { deadline += interval }
+                await self.waitForNextCycle(deviceID: device.id, until: deadline)
+                // Woken early by "Sync now": re-anchor the schedule on this sync.
+                if ContinuousClock.now < deadline { deadline = ContinuousClock.now }
             }
         }
         collectorTasks[device.id] = task
@@ -166,13 +211,9 @@ final class Coordinator {
                     dev?.status = .ok
                     dev?.lastSync = Date()
                     dev?.storedCount = count
+                    if let c = result.current { dev?.apply(c) }
+                    // After `apply`: the Battery service level, when read, beats the reading's.
                     if let b = result.battery { dev?.battery = b }
-                    if let c = result.current {
-                        if let v = c.co2 { dev?.co2 = v }
-                        if let v = c.temperature { dev?.temperature = v }
-                        if let v = c.humidity { dev?.humidity = v }
-                        if let v = c.pressure { dev?.pressure = v }
-                    }
                 }
                 AppLog.shared.info("Synced \(deviceID): +\(inserted) new (total \(count), device log \(result.total))")
                 return
@@ -191,8 +232,8 @@ final class Coordinator {
         }
     }
 
-    /// Wait until the next poll interval elapses or a manual "Sync now" arrives.
-    private func waitForNextCycle(deviceID: String) async {
+    /// Wait until `deadline` passes or a manual "Sync now" arrives.
+    private func waitForNextCycle(deviceID: String, until deadline: ContinuousClock.Instant) async {
         await withCheckedContinuation { (cont: CheckedContinuation<Void, Never>) in
             let waitID = UUID()
             var resumed = false
@@ -209,7 +250,7 @@ final class Coordinator {
             syncSignals[deviceID] = SyncSignal(id: waitID, resume: resumeOnce)
             sleepTask = Task {
                 do {
-                    try await Task.sleep(nanoseconds: UInt64(config.pollInterval * 1_000_000_000))
+                    try await Task.sleep(until: deadline, clock: .continuous)
                 } catch {
                     return
                 }
@@ -7,20 +7,24 @@ enum LoginItemManager {
         SMAppService.mainApp.status == .enabled
     }
 
-    static func setEnabled(_ enabled: Bool) {
+    /// Register or unregister the login item and return the resulting state. The status is an
+    /// XPC round trip to the system, so it's queried once up front and again only if something
+    /// changed — callers use the return value instead of re-reading `isEnabled`.
+    @discardableResult
+    static func setEnabled(_ enabled: Bool) -> Bool {
+        let service = SMAppService.mainApp
+        let wasEnabled = service.status == .enabled
+        guard enabled != wasEnabled else { return wasEnabled }
         do {
             if enabled {
-                if SMAppService.mainApp.status != .enabled {
-                    try SMAppService.mainApp.register()
-                }
+                try service.register()
             } else {
-                if SMAppService.mainApp.status == .enabled {
-                    try SMAppService.mainApp.unregister()
-                }
+                try service.unregister()
             }
             AppLog.shared.info("Login item \(enabled ? "enabled" : "disabled")")
         } catch {
             AppLog.shared.error("Failed to update login item: \(error)")
         }
+        return service.status == .enabled
     }
 }
@@ -41,6 +41,15 @@ final class DeviceState: Identifiable {
         self.name = name
     }
 
+    /// Take the measurements present in `reading`; missing ones keep their last value.
+    func apply(_ reading: AranetProtocol.CurrentReading) {
+        if let v = reading.co2 { co2 = v }
+        if let v = reading.temperature { temperature = v }
+        if let v = reading.humidity { humidity = v }
+        if let v = reading.pressure { pressure = v }
+        if let v = reading.battery { battery = v }
+    }
+
     var batteryIsLow: Bool { (battery ?? 100) <= 20 }
     var isStale: Bool {
         guard let lastSync else { return true }
@@ -149,9 +149,14 @@ struct MenuView: View {
         return panel.runModal() == .OK ? panel.url : nil
     }
 
+    /// Shared across renders; the menu re-evaluates `statusLine` for every device each time.
+    private static let relativeFormatter: RelativeDateTimeFormatter = {
+        let f = RelativeDateTimeFormatter()
+        f.unitsStyle = .short
+        return f
+    }()
+
     private func relative(_ date: Date) -> String {
-        let formatter = RelativeDateTimeFormatter()
-        formatter.unitsStyle = .short
-        return formatter.localizedString(for: date, relativeTo: Date())
+        MenuView.relativeFormatter.localizedString(for: date, relativeTo: Date())
     }
 }
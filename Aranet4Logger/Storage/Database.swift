@@ -9,10 +9,27 @@ import SQLite3
 /// collectors.
 actor Database {
     private var db: OpaquePointer?
+    /// Statements prepared once at open and reused (reset and rebound) on every call.
+    private var insertStmt: OpaquePointer?
+    private var lastTimestampStmt: OpaquePointer?
+    private var countStmt: OpaquePointer?
+    private var dataVersionStmt: OpaquePointer?
+
+    /// Row counts per device, filled by `count` on first use and then kept current by `insert`,
+    /// so the menu's stored-row count doesn't rescan the table after every sync. Dropped
+    /// whenever `PRAGMA data_version` moves, i.e. another connection (a CLI `--import` in a
+    /// separate process) has committed rows this actor didn't see.
+    private var counts: [String: Int] = [:]
+    private var countsDataVersion: Int64 = -1
+
+    private static let insertSQL = """
+        INSERT OR IGNORE INTO readings (device, timestamp, co2, temperature, humidity, pressure)
+        VALUES (?, ?, ?, ?, ?, ?);
+        """
 
     private static let SQLITE_TRANSIENT = unsafeBitCast(-1, to: sqlite3_destructor_type.self)
 
-    private let isoFormatter: ISO8601DateFormatter = {
+    private static let isoFormatter: ISO8601DateFormatter = {
         let f = ISO8601DateFormatter()
         f.formatOptions = [.withInternetDateTime, .withFractionalSeconds]
         f.timeZone = TimeZone(identifier: "UTC")
@@ -40,9 +57,18 @@ actor Database {
                 PRIMARY KEY (device, timestamp)
             );
             """)
+        insertStmt = try Database.prepareRaw(handle, Database.insertSQL, label: "insert")
+        lastTimestampStmt = try Database.prepareRaw(
+            handle, "SELECT MAX(timestamp) FROM readings WHERE device = ?;", label: "lastTimestamp")
+        countStmt = try Database.prepareRaw(
+            handle, "SELECT COUNT(*) FROM readings WHERE device = ?;", label: "count")
+        dataVersionStmt = try Database.prepareRaw(handle, "PRAGMA data_version;", label: "dataVersion")
     }
 
     deinit {
+        for stmt in [insertStmt, lastTimestampStmt, countStmt, dataVersionStmt] {
+            sqlite3_finalize(stmt)
+        }
         if let db { sqlite3_close(db) }
     }
 
@@ -69,6 +95,17 @@ actor Database {
         }
     }
 
+    /// Prepare a statement on a raw db handle; `nonisolated static` for the same reason as
+    /// `execRaw`.
+    nonisolated private static func prepareRaw(_ db: OpaquePointer, _ sql: String,
+                                               label: String) throws -> OpaquePointer? {
+        var stmt: OpaquePointer?
+        guard sqlite3_prepare_v2(db, sql, -1, &stmt, nil) == SQLITE_OK else {
+            throw DBError.prepare(message: "prepare \(label): \(String(cString: sqlite3_errmsg(db)))")
+        }
+        return stmt
+    }
+
     private func exec(_ sql: String) throws {
         try Database.execRaw(db, sql)
     }
@@ -79,22 +116,15 @@ actor Database {
         guard !readings.isEmpty else { return 0 }
         try exec("BEGIN IMMEDIATE TRANSACTION;")
         var inserted = 0
+        var pending: [String: Int] = [:]
         do {
-            let sql = """
-                INSERT OR IGNORE INTO readings (device, timestamp, co2, temperature, humidity, pressure)
-                VALUES (?, ?, ?, ?, ?, ?);
-                """
-            var stmt: OpaquePointer?
-            guard sqlite3_prepare_v2(db, sql, -1, &stmt, nil) == SQLITE_OK else {
-                throw DBError.prepare(message: "prepare insert: \(lastErrorMessage())")
-            }
-            defer { sqlite3_finalize(stmt) }
-
+            let stmt = insertStmt
+            // Every parameter (including NULLs) is rebound per row, so a reset between steps is
+            // all that's needed — no `sqlite3_clear_bindings` pass.
             for r in readings {
                 sqlite3_reset(stmt)
-                sqlite3_clear_bindings(stmt)
                 bindText(stmt, 1, r.deviceID)
-                bindText(stmt, 2, isoFormatter.string(from: r.timestamp))
+                bindText(stmt, 2, Database.timestampString(r.timestamp))
                 bindInt(stmt, 3, r.co2)
                 bindDouble(stmt, 4, r.temperature)
                 bindDouble(stmt, 5, r.humidity)
@@ -102,10 +132,18 @@ actor Database {
                 guard sqlite3_step(stmt) == SQLITE_DONE else {
                     throw DBError.step(message: "insert step: \(lastErrorMessage())")
                 }
-                inserted += sqlite3_changes(db) > 0 ? 1 : 0
+                if sqlite3_changes(db) > 0 {
+                    inserted += 1
+                    pending[r.deviceID, default: 0] += 1
+                }
             }
+            sqlite3_reset(stmt)
             try exec("COMMIT;")
+            for (device, n) in pending where counts[device] != nil {
+                counts[device]? += n
+            }
         } catch {
+            sqlite3_reset(insertStmt)
             try? exec("ROLLBACK;")
             throw error
         }
@@ -114,30 +152,79 @@ actor Database {
 
     /// Most recent stored timestamp for a device, used to bound incremental history downloads.
     func lastTimestamp(device: String) throws -> Date? {
-        let sql = "SELECT MAX(timestamp) FROM readings WHERE device = ?;"
-        var stmt: OpaquePointer?
-        guard sqlite3_prepare_v2(db, sql, -1, &stmt, nil) == SQLITE_OK else {
-            throw DBError.prepare(message: "prepare lastTimestamp: \(lastErrorMessage())")
-        }
-        defer { sqlite3_finalize(stmt) }
+        let stmt = lastTimestampStmt
+        defer { sqlite3_reset(stmt) }
         bindText(stmt, 1, device)
         guard sqlite3_step(stmt) == SQLITE_ROW else { return nil }
         guard sqlite3_column_type(stmt, 0) != SQLITE_NULL,
               let cString = sqlite3_column_text(stmt, 0) else { return nil }
-        return isoFormatter.date(from: String(cString: cString))
+        return Database.isoFormatter.date(from: String(cString: cString))
     }
 
     /// Number of stored rows for a device (shown in the menu).
     func count(device: String) throws -> Int {
-        let sql = "SELECT COUNT(*) FROM readings WHERE device = ?;"
-        var stmt: OpaquePointer?
-        guard sqlite3_prepare_v2(db, sql, -1, &stmt, nil) == SQLITE_OK else {
-            throw DBError.prepare(message: "prepare count: \(lastErrorMessage())")
+        let version = dataVersion()
+        if version < 0 || version != countsDataVersion {
+            counts.removeAll()
+            countsDataVersion = version
         }
-        defer { sqlite3_finalize(stmt) }
+        if let cached = counts[device] { return cached }
+        let stmt = countStmt
+        defer { sqlite3_reset(stmt) }
         bindText(stmt, 1, device)
         guard sqlite3_step(stmt) == SQLITE_ROW else { return 0 }
-        return Int(sqlite3_column_int64(stmt, 0))
+        let n = Int(sqlite3_column_int64(stmt, 0))
+        counts[device] = n
+        return n
+    }
+
+    /// SQLite's change counter for commits made by *other* connections; -1 if unavailable.
+    private func dataVersion() -> Int64 {
+        let stmt = dataVersionStmt
+        defer { sqlite3_reset(stmt) }
+        guard sqlite3_step(stmt) == SQLITE_ROW else { return -1 }
+        return sqlite3_column_int64(stmt, 0)
+    }
+
+    // MARK: - Timestamps
+
+    /// Format a timestamp exactly as `isoFormatter` does (`2026-03-28T12:08:00.000Z`), which is
+    /// the stored key format. Readings are snapped to whole seconds, so the usual case is built
+    /// directly from `gmtime_r` fields — `ISO8601DateFormatter` is slow enough to dominate a
+    /// large history insert. Fractional or out-of-range dates fall back to the formatter.
+    static func timestampString(_ date: Date) -> String {
+        guard let seconds = Int(exactly: date.timeIntervalSince1970) else {
+            return isoFormatter.string(from: date)
+        }
+        var time = time_t(seconds)
+        var parts = tm()
+        guard gmtime_r(&time, &parts) != nil, (1000...9999).contains(parts.tm_year + 1900) else {
+            return isoFormatter.string(from: date)
+        }
+
+        var bytes: [UInt8] = []
+        bytes.reserveCapacity(24)
+        func digits(_ value: Int32, _ width: Int) {
+            var divisor: Int32 = 1
+            for _ in 1..<width { divisor *= 10 }
+            while divisor > 0 {
+                bytes.append(UInt8(ascii: "0") + UInt8((value / divisor) % 10))
+                divisor /= 10
+            }
+        }
+        digits(parts.tm_year + 1900, 4)
+        bytes.append(UInt8(ascii: "-"))
+        digits(parts.tm_mon + 1, 2)
+        bytes.append(UInt8(ascii: "-"))
+        digits(parts.tm_mday, 2)
+        bytes.append(UInt8(ascii: "T"))
+        digits(parts.tm_hour, 2)
+        bytes.append(UInt8(ascii: ":"))
+        digits(parts.tm_min, 2)
+        bytes.append(UInt8(ascii: ":"))
+        digits(parts.tm_sec, 2)
+        bytes.append(contentsOf: ".000Z".utf8)
+        return String(decoding: bytes, as: UTF8.self)
     }
 
     // MARK: - Binding helpers
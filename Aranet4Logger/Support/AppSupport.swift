@@ -11,9 +11,10 @@ enum AppPaths {
         return dir
     }()
 
-    static var config: URL { directory.appendingPathComponent("config.json") }
-    static var database: URL { directory.appendingPathComponent("aranet.sqlite") }
-    static var logFile: URL { directory.appendingPathComponent("aranet.log") }
+    // Resolved once, like `directory` (whose initializer also creates the folder).
+    static let config = directory.appendingPathComponent("config.json")
+    static let database = directory.appendingPathComponent("aranet.sqlite")
+    static let logFile = directory.appendingPathComponent("aranet.log")
 }
 
 /// Lightweight logger that writes timestamped lines to both the unified log and aranet.log.
@@ -28,6 +29,13 @@ final class AppLog: @unchecked Sendable {
         f.formatOptions = [.withInternetDateTime]
         return f
     }()
+    /// aranet.log, opened on first write and kept open, and its current size. Only touched on
+    /// `queue`.
+    private var handle: FileHandle?
+    private var size: UInt64 = 0
+    /// Past this size aranet.log is rotated to aranet.log.1 (replacing any previous one), so the
+    /// log never takes more than about twice this on disk.
+    private static let maxSize: UInt64 = 5 * 1024 * 1024
 
     func info(_ message: String) {
         logger.info("\(message, privacy: .public)")
@@ -39,18 +47,52 @@ final class AppLog: @unchecked Sendable {
         write("ERROR", message)
     }
 
+    /// Block until every queued line is written and synced to disk. Called at termination.
+    func flush() {
+        queue.sync { try? handle?.synchronize() }
+    }
+
+    /// Only the timestamp is captured on the caller (often the main actor); formatting and file
+    /// I/O happen on the serial log queue.
     private func write(_ level: String, _ message: String) {
-        let line = "\(dateFormatter.string(from: Date())) [\(level)] \(message)\n"
+        let date = Date()
         queue.async {
-            guard let data = line.data(using: .utf8) else { return }
-            let url = AppPaths.logFile
-            if let handle = try? FileHandle(forWritingTo: url) {
-                defer { try? handle.close() }
-                _ = try? handle.seekToEnd()
-                try? handle.write(contentsOf: data)
-            } else {
-                try? data.write(to: url)
-            }
+            let line = "\(self.dateFormatter.string(from: date)) [\(level)] \(message)\n"
+            self.append(Data(line.utf8))
+        }
+    }
+
+    /// Append to aranet.log through the cached handle, (re)opening it on first use or after a
+    /// failed write. Must be called on `queue`.
+    private func append(_ data: Data) {
+        if handle == nil {
+            // A single open(2) creates the file if missing (no separate existence check), and
+            // O_APPEND keeps every write at the end of the file.
+            let fd = open(AppPaths.logFile.path, O_WRONLY | O_CREAT | O_APPEND, 0o644)
+            guard fd >= 0 else { return }
+            let opened = FileHandle(fileDescriptor: fd, closeOnDealloc: true)
+            handle = opened
+            size = (try? opened.seekToEnd()) ?? 0
+        }
+        do {
+            try handle?.write(contentsOf: data)
+            size += UInt64(data.count)
+        } catch {
+            try? handle?.close()
+            handle = nil
+            return
         }
+        if size >= AppLog.maxSize { rotate() }
+    }
+
+    /// Move the full log aside; the next write starts a fresh aranet.log. Must be called on
+    /// `queue`.
+    private func rotate() {
+        try? handle?.close()
+        handle = nil
+        let url = AppPaths.logFile
+        let rotated = url.appendingPathExtension("1")
+        try? FileManager.default.removeItem(at: rotated)
+        try? FileManager.default.moveItem(at: url, to: rotated)
     }
 }
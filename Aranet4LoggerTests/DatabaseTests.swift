@@ -55,4 +55,59 @@ final class DatabaseTests: XCTestCase {
         XCTAssertEqual(countA, 1)
         XCTAssertEqual(countB, 1)
     }
+
+    func testCountStaysCurrentAfterInserts() async throws {
+        let db = try makeTempDatabase()
+        let t1 = Date(timeIntervalSince1970: 1_700_000_000)
+        let t2 = Date(timeIntervalSince1970: 1_700_000_300)
+        _ = try await db.insert([
+            Reading(deviceID: "DEV-A", timestamp: t1, co2: 1, temperature: nil, humidity: nil, pressure: nil),
+        ])
+        let before = try await db.count(device: "DEV-A")
+        XCTAssertEqual(before, 1)
+
+        // A cached count picks up new rows but not ignored duplicates.
+        _ = try await db.insert([
+            Reading(deviceID: "DEV-A", timestamp: t1, co2: 1, temperature: nil, humidity: nil, pressure: nil),
+            Reading(deviceID: "DEV-A", timestamp: t2, co2: 2, temperature: nil, humidity: nil, pressure: nil),
+        ])
+        let after = try await db.count(device: "DEV-A")
+        XCTAssertEqual(after, 2)
+    }
+
+    func testCountSeesCommitsFromAnotherConnection() async throws {
+        let path = FileManager.default.temporaryDirectory
+            .appendingPathComponent("aranet-test-\(UUID().uuidString).sqlite").path
+        let app = try Database(path: path)
+        let cli = try Database(path: path)
+        let t1 = Date(timeIntervalSince1970: 1_700_000_000)
+        let t2 = Date(timeIntervalSince1970: 1_700_000_300)
+        _ = try await app.insert([
+            Reading(deviceID: "DEV-A", timestamp: t1, co2: 1, temperature: nil, humidity: nil, pressure: nil),
+        ])
+        let before = try await app.count(device: "DEV-A")
+        XCTAssertEqual(before, 1)
+
+        // Rows committed by a second connection (like a CLI `--import`) invalidate the cache.
+        _ = try await cli.insert([
+            Reading(deviceID: "DEV-A", timestamp: t2, co2: 2, temperature: nil, humidity: nil, pressure: nil),
+        ])
+        let after = try await app.count(device: "DEV-A")
+        XCTAssertEqual(after, 2)
+    }
+
+    func testTimestampStringMatchesISOFormatter() {
+        let reference = ISO8601DateFormatter()
+        reference.formatOptions = [.withInternetDateTime, .withFractionalSeconds]
+        reference.timeZone = TimeZone(identifier: "UTC")
+        let dates = [
+            Date(timeIntervalSince1970: 0),
+            Date(timeIntervalSince1970: 1_700_000_000),
+            Date(timeIntervalSince1970: 1_709_208_000),   // leap day 2024
+            Date(timeIntervalSince1970: 1_700_000_000.25),  // fractional: formatter fallback
+        ]
+        for date in dates {
+            XCTAssertEqual(Database.timestampString(date), reference.string(from: date))
+        }
+    }
 }